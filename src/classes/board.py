@@ -31,8 +31,9 @@ class Board:
         update_attack_overlays(selected_unit, all_units): Updates the dangerous and attackable squares
         get_square_from_click(mouse_pos, screen): Determines which square was clicked based on mouse position.
         select_square(square, movement_points): Selects a square and calculates reachable positions based on movement points.
-        initialize_terrain(terrain_map): Initializes the terrain map from a provided map string.
+        initialize_terrain(terrain_map): Initializes the terrain map from the rows of a provided map.
         draw(screen, selected_square): Draws the board, with highlights for reachable and selected squares.
+        _get_scaled_tiles(square_width, square_height): Returns the board tiles scaled to the square size.
     """
 
 
@@ -50,12 +51,7 @@ class Board:
             map_choice (int, optional): Choice of terrain map. Defaults to None.
         """
 
-        if map_choice == 1:
-            self.terrain_map = Maps.map1
-        elif map_choice == 2:
-            self.terrain_map = Maps.map2
-        else:
-            self.terrain_map = Maps.map1 
+        self.terrain_map = Maps.MAP1_ROWS #map1 is the only map so far, whatever the choice
             
         self.m = m
         self.n = n
@@ -86,6 +82,8 @@ class Board:
 
         self.dangerous_squares = set()
         self.attackable_squares = set()
+        self._tile_size = None
+        self._scaled_tiles = {}
 
     def _is_valid_position(self, row: int, col: int) -> bool:
 
@@ -120,28 +118,31 @@ class Board:
         
         if not selected_unit:
             return
-                
-        enemy_units = [unit for unit in all_units if unit.is_alive and unit.player != selected_unit.player]
+
+        player = selected_unit.player
+        enemies = [
+            (unit.position[0], unit.position[1], unit.attack_range)
+            for unit in all_units
+            if unit.is_alive and unit.player != player
+        ]
         
         all_dangerous = set()
-        for enemy in enemy_units:
-            row, col = enemy.position
-            attack_range = enemy.attack_range
-            
+        for row, col, attack_range in enemies:
             for i in range(-attack_range, attack_range + 1):
                 for j in range(-attack_range, attack_range + 1):
                     new_row, new_col = row + i, col + j
                     if (self._is_valid_position(new_row, new_col) and 
                         abs(i) + abs(j) <= attack_range and
-                        (new_row, new_col) != enemy.position): 
+                        (i, j) != (0, 0)): 
                         all_dangerous.add((new_row, new_col))
         
         self.dangerous_squares = all_dangerous.intersection(self.reachable_positions)
     
-        for enemy in enemy_units:
-            enemy_pos = enemy.position
-            if selected_unit.can_attack(enemy_pos):
-                self.attackable_squares.add(enemy_pos)
+        enemy_positions = [(row, col) for row, col, _ in enemies]
+        in_range = selected_unit.can_attack_many(enemy_positions)
+        self.attackable_squares.update(
+            pos for pos, attackable in zip(enemy_positions, in_range) if attackable
+        )
 
 
     def get_square_from_click(self, mouse_pos, screen) -> tuple[int, int] | None:
@@ -221,10 +222,10 @@ class Board:
     def initialize_terrain(self, terrain_map) -> dict:
 
         """
-        Initializes the terrain map from a provided map string.
+        Initializes the terrain map from the rows of a provided map.
 
         Args:
-            terrain_map (str): A string representation of the terrain map where each line corresponds to a row 
+            terrain_map (tuple): The stripped rows of the terrain map (e.g. Maps.MAP1_ROWS), where each string corresponds to a row 
             and each character represents a type of terrain. The expected characters are:
                 - '#' for plains
                 - '.' for mountains
@@ -240,9 +241,8 @@ class Board:
         """
 
         terrain = {}
-        rows = [row.strip() for row in terrain_map.strip().split("\n")]
 
-        for row_index, row in enumerate(rows):
+        for row_index, row in enumerate(terrain_map):
             for col_index, cell in enumerate(row):
                 if cell == "#":
                     terrain[(row_index, col_index)] = "plains"
@@ -279,46 +279,62 @@ class Board:
         width, height = screen.get_size()
         square_width = width // self.n
         square_height = height // self.m
+        tiles = self._get_scaled_tiles(square_width, square_height)
+        plains_tile = tiles["plains"]
 
         for row in range(self.m):
             for column in range(self.n):
+                square_pos = (row, column)
+                tile_pos = (column * square_width, row * square_height)
 
                 # First plains, then the rest
-                plains_sprite = self.sprites["plains"]
-                plains_sprite_scaled = pygame.transform.scale(plains_sprite, (square_width, square_height))
-                screen.blit(plains_sprite_scaled, (column * square_width, row * square_height))
-
-                if self.terrain[(row, column)] == "mountain":
-                    mountain_sprite = self.sprites["mountain"]
-                    mountain_sprite_scaled = pygame.transform.scale(mountain_sprite, (square_width, square_height))
-                    screen.blit(mountain_sprite_scaled, (column * square_width, row * square_height))
-                
-                if self.terrain[(row, column)] == "forest":
-                    forest_sprite = self.sprites["forest"]
-                    forest_sprite_scaled = pygame.transform.scale(forest_sprite, (square_width, square_height))
-                    screen.blit(forest_sprite_scaled, (column * square_width, row * square_height))
-
-                if (row, column) in self.reachable_positions:
-                    highlight_surface = pygame.Surface((square_width, square_height), pygame.SRCALPHA)
-                    pygame.draw.rect(highlight_surface, Colors.COLOR_HIGHLIGHT, (0, 0, square_width, square_height))
-                    screen.blit(highlight_surface, (column * square_width, row * square_height))
-       
-                square_pos = (row, column)
+                screen.blit(plains_tile, tile_pos)
+
+                terrain = self.terrain[square_pos]
+                if terrain == "mountain" or terrain == "forest":
+                    screen.blit(tiles[terrain], tile_pos)
+
+                if square_pos in self.reachable_positions:
+                    screen.blit(tiles["highlight"], tile_pos)
 
                 if square_pos in self.dangerous_squares:
-                    dangerous_sprite = pygame.transform.scale(
-                        self.sprites["dangerous"],
-                        (square_width, square_height)
-                    )
-                    dangerous_sprite.set_alpha(128)  # 50% transparency
-                    screen.blit(dangerous_sprite, 
-                              (column * square_width, row * square_height))
+                    screen.blit(tiles["dangerous"], tile_pos)
                 
                 if square_pos in self.attackable_squares:
-                    attackable_sprite = pygame.transform.scale(
-                        self.sprites["attackable"],
-                        (square_width, square_height)
-                    )
-                    attackable_sprite.set_alpha(128)  # 50% transparency
-                    screen.blit(attackable_sprite, 
-                              (column * square_width, row * square_height))
\ No newline at end of file
+                    screen.blit(tiles["attackable"], tile_pos)
+
+    def _get_scaled_tiles(self, square_width, square_height) -> dict:
+
+        """
+        Returns the terrain and overlay tiles scaled to the current square size.
+
+        The tiles are only rebuilt when the square size changes (e.g. on resize),
+        instead of rescaling every sprite for every square on every frame.
+
+        Args:
+            square_width (int): Width of a board square in pixels.
+            square_height (int): Height of a board square in pixels.
+
+        Returns:
+            dict: Scaled "plains", "mountain", "forest", "dangerous" and "attackable"
+                  sprites, plus the "highlight" surface for reachable squares.
+        """
+
+        size = (square_width, square_height)
+        if self._tile_size == size:
+            return self._scaled_tiles
+
+        tiles = {
+            name: pygame.transform.scale(self.sprites[name], size)
+            for name in ("plains", "mountain", "forest", "dangerous", "attackable")
+        }
+        tiles["dangerous"].set_alpha(128)  # 50% transparency
+        tiles["attackable"].set_alpha(128)  # 50% transparency
+
+        highlight_surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(highlight_surface, Colors.COLOR_HIGHLIGHT, (0, 0, square_width, square_height))
+        tiles["highlight"] = highlight_surface
+
+        self._tile_size = size
+        self._scaled_tiles = tiles
+        return tiles
@@ -10,6 +10,7 @@ from ..input.input_handler import InputHandler
 from ..turn.turn_manager import TurnManager
 from .state_manager import GameStateManager
 from ...board import Board
+from ...units.base.unit_rendering import preload_sprites
 
 class GameManager:
     def __init__(self, player1_general=None, player2_general=None, map_choice=1) -> None:
@@ -83,6 +84,7 @@ class GameManager:
         
         self.state_manager.board = self.board
         
+        preload_sprites()
         self.state_manager.setup_units()
         
         self.renderer = GameRenderer(self.screen, self.board)
@@ -100,7 +102,6 @@ class GameManager:
         try:
             while self.state_manager.running:
                 self.input_handler.handle_events()
-                self.update()
                 self.renderer.render(self.state_manager, self.ui_renderer)
 
             return {
@@ -111,18 +112,6 @@ class GameManager:
             print(f"Game crashed: {str(e)}")
             return {'return_to_menu': True}  
 
-    def update(self) -> None:
-        
-        """
-        Updates the game state.
-        """
-
-        try:        
-            self.renderer.draw_board()
-                    
-        except Exception as e:
-            raise RuntimeError(f"Failed to draw the board: {str(e)}")
-
     def toggle_fullscreen(self) -> None:
         
         """
@@ -3,6 +3,7 @@ Main renderer responsible for game visualization.
 """
 
 import pygame
+from ...units.base.base_unit import BaseUnit
 
 class GameRenderer:
     def __init__(self, screen, board) -> None:
@@ -15,7 +16,10 @@ class GameRenderer:
         self.board = board
         self.base_surface = pygame.Surface((board.initial_width, board.initial_height), pygame.SRCALPHA)
         self.board_surface = self.base_surface.copy()
+        self.scaled_board_surface = None
         self.background = pygame.Surface(screen.get_size())
+        self.board_layer_state = None
+        self.presented_size = None
         self.init_fonts()
 
     def update_surfaces(self, board_width, board_height) -> None:
@@ -31,25 +35,43 @@ class GameRenderer:
         self.board_width = board_width
         self.board_height = board_height
         self.board_surface = pygame.Surface((board_width, board_height), pygame.SRCALPHA)
+        self.scaled_board_surface = None
         self.background = pygame.Surface(self.screen.get_size())
+        self.board_layer_state = None
 
     def render(self, state_manager, ui_renderer) -> None:
         
         """
         Render the game state.
 
+        When neither the board layer nor the screen size changed since the last
+        full frame, the board part of the screen is left as it is and only the
+        status panel is redrawn and pushed to the display.
+
         Args:
             state_manager (StateManager): The state manager.
             ui_renderer (UIRenderer): The UI renderer.
         """
 
+        units = state_manager.get_all_units()
+        board_layer_state = self._get_board_layer_state(state_manager, units)
+        screen_size = self.screen.get_size()
+        if (board_layer_state == self.board_layer_state and screen_size == self.presented_size
+                and not state_manager.game_over):
+            ui_renderer.render(state_manager)
+            pygame.display.update(pygame.Rect(screen_size[0] - 300, 0, 300, screen_size[1]))
+            return
+
         self.screen.fill((0, 0, 0))
-        self.board_surface.fill((0, 0, 0, 0))
-        
-        self.board.draw(self.board_surface, state_manager.selected_square)
-        for unit in state_manager.get_all_units():
-            if unit.is_alive:
-                unit.draw(self.board_surface, self.board)
+
+        layer_redrawn = board_layer_state != self.board_layer_state
+        if layer_redrawn:
+            self.board_surface.fill((0, 0, 0, 0))
+            
+            self.board.draw(self.board_surface, state_manager.selected_square)
+            BaseUnit.draw_batch(units, self.board_surface, self.board)
+
+            self.board_layer_state = board_layer_state
 
         if self.board.is_fullscreen:
             game_width = self.screen.get_width() - 300  
@@ -62,7 +84,12 @@ class GameRenderer:
             actual_width = int(self.board.initial_width * scale)
             actual_height = int(self.board.initial_height * scale)
             
-            scaled = pygame.transform.smoothscale(self.board_surface, (actual_width, actual_height))
+            scaled = self.scaled_board_surface
+            if scaled is None or scaled.get_size() != (actual_width, actual_height):
+                scaled = self.scaled_board_surface = pygame.Surface((actual_width, actual_height), pygame.SRCALPHA)
+                layer_redrawn = True
+            if layer_redrawn:
+                pygame.transform.smoothscale(self.board_surface, (actual_width, actual_height), scaled)
             
             board_y = (game_height - actual_height) // 2
             
@@ -81,6 +108,31 @@ class GameRenderer:
             self._draw_victory_message(state_manager.winner)
         
         pygame.display.flip()
+        self.presented_size = screen_size
+
+    def _get_board_layer_state(self, state_manager, units) -> tuple:
+
+        """
+        Collects everything drawn on the board surface, so an unchanged board
+        and unchanged units can reuse the previous frame's board surface.
+
+        Args:
+            state_manager (StateManager): The state manager.
+            units (list): All units in the game.
+
+        Returns:
+            tuple: Snapshot of the selection, the highlighted squares and every unit's render state.
+        """
+
+        board = self.board
+        return (
+            state_manager.selected_square,
+            board.selected_square,
+            frozenset(board.reachable_positions),
+            frozenset(board.dangerous_squares),
+            frozenset(board.attackable_squares),
+            tuple(unit.render_state() for unit in units)
+        )
 
     def init_fonts(self) -> None:
 
@@ -97,11 +149,11 @@ class GameRenderer:
     def draw_board(self) -> None:
         
         """
-        Draws the board.
+        Marks the board for redrawing on the next frame.
         """
 
         self.background.fill((0, 0, 0))
-        self.board.draw(self.board_surface, self.board.selected_square)
+        self.board_layer_state = None
         
     def _draw_victory_message(self, winner) -> None:
         
@@ -29,6 +29,33 @@ class UIRenderer:
         self.title_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 36)
         self.mini_font = pygame.font.Font(None, 24)
+        self.text_cache = {}
+
+    def _render_text(self, font, text, color) -> pygame.Surface:
+
+        """
+        Render antialiased text, reusing the surface from earlier frames.
+
+        Most panel labels are the same every frame, so each (font, text, color)
+        combination is rasterized once. The cache is emptied if it grows large,
+        which only happens as changing values (e.g. HP) produce new strings.
+
+        Args:
+            font (pygame.font.Font): Font to render with.
+            text (str): Text to render.
+            color (tuple): Text color.
+
+        Returns:
+            pygame.Surface: The rendered text. Callers must not draw on it.
+        """
+
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= 512:
+                self.text_cache.clear()
+            surface = self.text_cache[key] = font.render(text, True, color)
+        return surface
 
     def setup_colors(self) -> None:
         
@@ -74,7 +101,7 @@ class UIRenderer:
 
         y_offset = SECTION_PADDING
 
-        header_text = self.title_font.render("Unit Status", True, self.colors['header'])
+        header_text = self._render_text(self.title_font, "Unit Status", self.colors['header'])
         header_rect = header_text.get_rect(centerx=PANEL_WIDTH // 2, top=y_offset)
         self.status_surface.blit(header_text, header_rect)
 
@@ -85,11 +112,11 @@ class UIRenderer:
         self.status_surface.blit(turn_bg, (20, y_offset))
 
         turn_text = f"Player {state_manager.current_player}'s Turn"
-        turn_surface = self.small_font.render(turn_text, True, self.colors['header'])
+        turn_surface = self._render_text(self.small_font, turn_text, self.colors['header'])
         self.status_surface.blit(turn_surface, (30, y_offset + 10))
 
         space_text = "Press SPACE to end turn"
-        space_surface = self.mini_font.render(space_text, True, self.colors['text'])
+        space_surface = self._render_text(self.mini_font, space_text, self.colors['text'])
         self.status_surface.blit(space_surface, (30, y_offset + 35))
 
         y_offset += 80
@@ -99,7 +126,7 @@ class UIRenderer:
         y_offset += SECTION_PADDING
 
         if not state_manager.selected_unit:
-            no_unit_text = self.mini_font.render("No Unit Selected", True, self.colors['text'])
+            no_unit_text = self._render_text(self.mini_font, "No Unit Selected", self.colors['text'])
             no_unit_rect = no_unit_text.get_rect(centerx=PANEL_WIDTH // 2, top=y_offset)
             self.status_surface.blit(no_unit_text, no_unit_rect)
         else:
@@ -125,11 +152,11 @@ class UIRenderer:
         section_bg.fill(self.colors['section_bg'])
         self.status_surface.blit(section_bg, (20, y_offset))
 
-        type_text = self.small_font.render(unit.__class__.__name__, True, self.colors['header'])
+        type_text = self._render_text(self.small_font, unit.__class__.__name__, self.colors['header'])
         self.status_surface.blit(type_text, (30, y_offset + 10))
 
         hp_percent = (unit.current_hp / unit.max_hp) * 100
-        hp_text = self.mini_font.render(f"HP: {hp_percent:.1f}%", True, self.colors['text'])
+        hp_text = self._render_text(self.mini_font, f"HP: {hp_percent:.1f}%", self.colors['text'])
         self.status_surface.blit(hp_text, (30, y_offset + 40))
 
         pygame.draw.rect(self.status_surface, self.colors['separator'],
@@ -148,7 +175,7 @@ class UIRenderer:
         section_bg.fill(self.colors['section_bg'])
         self.status_surface.blit(section_bg, (20, y_offset))
 
-        section_title = self.mini_font.render("COMBAT STATS", True, self.colors['section_title'])
+        section_title = self._render_text(self.mini_font, "COMBAT STATS", self.colors['section_title'])
         self.status_surface.blit(section_title, (30, y_offset + 10))
 
         stats_y = y_offset + 40
@@ -159,7 +186,7 @@ class UIRenderer:
         ]
 
         for text, color in stats_data:
-            stat_text = self.mini_font.render(text, True, color)
+            stat_text = self._render_text(self.mini_font, text, color)
             self.status_surface.blit(stat_text, (30, stats_y))
             stats_y += 25
 
@@ -169,7 +196,7 @@ class UIRenderer:
         section_bg.fill(self.colors['section_bg'])
         self.status_surface.blit(section_bg, (20, y_offset))
 
-        section_title = self.mini_font.render("TACTICAL INFO", True, self.colors['section_title'])
+        section_title = self._render_text(self.mini_font, "TACTICAL INFO", self.colors['section_title'])
         self.status_surface.blit(section_title, (30, y_offset + 10))
 
         facing_text = Direction.to_string(unit.facing_direction)
@@ -183,7 +210,7 @@ class UIRenderer:
         ]
 
         for text, color in tactical_data:
-            tact_text = self.mini_font.render(text, True, color)
+            tact_text = self._render_text(self.mini_font, text, color)
             self.status_surface.blit(tact_text, (30, tactical_y))
             tactical_y += 25
 
@@ -206,7 +233,7 @@ class UIRenderer:
         section_bg.fill(self.colors['section_bg'])
         self.status_surface.blit(section_bg, (20, y_offset))
 
-        section_title = self.mini_font.render("ACTIVE MODIFIERS", True, self.colors['section_title'])
+        section_title = self._render_text(self.mini_font, "ACTIVE MODIFIERS", self.colors['section_title'])
         self.status_surface.blit(section_title, (30, y_offset + 10))
 
         mod_y = y_offset + 40
@@ -220,35 +247,35 @@ class UIRenderer:
                 sign = "+" if attack_mod > 0 else ""
                 mod_text = f"{sign}{attack_mod:.0f}% Attack ({unit.formation})"
                 mod_color = self.colors['hp_good'] if attack_mod > 0 else self.colors['hp_bad']
-                mod_surface = self.mini_font.render(mod_text, True, mod_color)
+                mod_surface = self._render_text(self.mini_font, mod_text, mod_color)
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
 
             # Defense modifiers with attack type specification
             if unit.formation == "Spread":
                 mod_text = f"+20% Ranged Defense (Spread)"
-                mod_surface = self.mini_font.render(mod_text, True, self.colors['hp_good'])
+                mod_surface = self._render_text(self.mini_font, mod_text, self.colors['hp_good'])
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
             elif unit.formation == "Shield Wall":
-                mod_surface = self.mini_font.render("+50% Melee Defense (Shield Wall)", True, self.colors['hp_good'])
+                mod_surface = self._render_text(self.mini_font, "+50% Melee Defense (Shield Wall)", self.colors['hp_good'])
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
-                mod_surface = self.mini_font.render("+150% Ranged Defense (Shield Wall)", True, self.colors['hp_good'])
+                mod_surface = self._render_text(self.mini_font, "+150% Ranged Defense (Shield Wall)", self.colors['hp_good'])
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
             elif unit.formation == "Phalanx" and unit.attack_type == "melee":
-                mod_surface = self.mini_font.render("+300% Frontal Defense (Phalanx)", True, self.colors['hp_good'])
+                mod_surface = self._render_text(self.mini_font, "+300% Frontal Defense (Phalanx)", self.colors['hp_good'])
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
-                mod_surface = self.mini_font.render("-20% Other Directions (Phalanx)", True, self.colors['hp_bad'])
+                mod_surface = self._render_text(self.mini_font, "-20% Other Directions (Phalanx)", self.colors['hp_bad'])
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
             elif unit.formation == "Turtle" and unit.attack_type == "melee":
-                mod_surface = self.mini_font.render("+", True, self.colors['hp_good'])
+                mod_surface = self._render_text(self.mini_font, "+", self.colors['hp_good'])
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
-                mod_surface = self.mini_font.render("-20% Other Directions (Phalanx)", True, self.colors['hp_bad'])
+                mod_surface = self._render_text(self.mini_font, "-20% Other Directions (Phalanx)", self.colors['hp_bad'])
                 self.status_surface.blit(mod_surface, (30, mod_y))
                 mod_y += 25
 
@@ -260,7 +287,7 @@ class UIRenderer:
                         mod_text = "+50% Melee Defense (Mountain)"
                     else:
                         mod_text = "+20% Ranged Defense (Mountain)"
-                    mod_surface = self.mini_font.render(mod_text, True, self.colors['hp_good'])
+                    mod_surface = self._render_text(self.mini_font, mod_text, self.colors['hp_good'])
                     self.status_surface.blit(mod_surface, (30, mod_y))
                     mod_y += 25
             elif unit.terrain == "forest":
@@ -269,13 +296,13 @@ class UIRenderer:
                         mod_text = "+70% Ranged Defense (Forest)"
                     else:
                         mod_text = "+25% Melee Defense (Forest)"
-                    mod_surface = self.mini_font.render(mod_text, True, self.colors['hp_good'])
+                    mod_surface = self._render_text(self.mini_font, mod_text, self.colors['hp_good'])
                     self.status_surface.blit(mod_surface, (30, mod_y))
                     mod_y += 25
 
         # Add attack type info
         attack_type_text = f"Attack Type: {unit.attack_type.capitalize()}"
-        attack_surface = self.mini_font.render(attack_type_text, True, self.colors['text'])
+        attack_surface = self._render_text(self.mini_font, attack_type_text, self.colors['text'])
         self.status_surface.blit(attack_surface, (30, mod_y))
         mod_y += 25
 
@@ -336,6 +363,6 @@ class UIRenderer:
         for direction, label, x, y in direction_labels:
             is_current = Direction[direction] == current_direction
             color = (252, 211, 77) if is_current else self.colors['text']
-            text = self.small_font.render(label, True, color)
+            text = self._render_text(self.small_font, label, color)
             text_rect = text.get_rect(center=(x, y))
             self.status_surface.blit(text, text_rect)
\ No newline at end of file
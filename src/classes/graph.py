@@ -17,6 +17,7 @@ class BoardGraph:
         terrain (Dict[Tuple[int, int], str]): Mapping from positions to terrain types.
         units (List[dict]): List of units with their positions and statuses.
         graph (defaultdict): Dictionary representing the graph, where each position is connected to its neighbors.
+        occupied (Set[Tuple[int, int]]): Positions held by living units, rebuilt with the graph.
 
     Methods:
         _is_valid_position(row, col): Checks if a position is within the board boundaries.
@@ -77,6 +78,8 @@ class BoardGraph:
             (0, -1),           (0, 1),   
                      (1, 0),      
         ]
+
+        self.occupied = {unit.position for unit in self.units if unit.is_alive}
     
         for row in range(self.m):
             for col in range(self.n):
@@ -102,9 +105,8 @@ class BoardGraph:
             float: The cost of moving from pos1 to pos2. Infinite if the path is blocked by a living unit.
         """
         
-        for unit in self.units:
-            if unit.is_alive and unit.position == pos2:
-                return float('infinity')
+        if pos2 in self.occupied:
+            return float('infinity')
 
         terrain1 = self.terrain[pos1]
         terrain2 = self.terrain[pos2]
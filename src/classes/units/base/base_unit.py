@@ -9,11 +9,39 @@ from ..constants.colors import Colors
 from .unit_combat import UnitCombatMixin
 from .unit_movement import UnitMovementMixin
 from .unit_rendering import UnitRenderingMixin
-from .unit_formation import UnitFormationMixin
+from .unit_formation import UnitFormationMixin, freeze_formations
 from .unit_direction import DirectionMixin
 from .unit_direction import Direction
 
+#sound path -> pygame.mixer.Sound, shared by every unit using that file
+_SOUND_CACHE = {}
+
+#player -> unit colors, shared by all of that player's units (read-only)
+_PLAYER1_COLORS = {
+    'primary': Colors.PLAYER1_PRIMARY,
+    'secondary': Colors.PLAYER1_SECONDARY,
+    'hover': Colors.PLAYER1_PRIMARY_HOVER
+}
+_PLAYER2_COLORS = {
+    'primary': Colors.PLAYER2_PRIMARY,
+    'secondary': Colors.PLAYER2_SECONDARY,
+    'hover': Colors.PLAYER2_PRIMARY_HOVER
+}
+
 class BaseUnit(UnitCombatMixin, UnitMovementMixin, UnitRenderingMixin, UnitFormationMixin, DirectionMixin):
+    __slots__ = (
+        '_position', '_pos_r', '_pos_c', 'is_alive', 'terrain', 'general_id', 'has_attacked',
+        'facing_direction', 'has_changed_direction', 'formation', 'formations',
+        'player', 'movement_range', 'size', 'has_general',
+        'max_hp', 'current_hp', 'base_attack', 'base_defense', 'base_missile_defense',
+        'attack_type', 'attack_range', 'attack_points', 'defense_points',
+        'colors', 'sprite', '_scaled_sprite', '_scaled_size', 'move_sound', 'attack_sound',
+        '_audio_enabled', '_reachable_cache', '_formation_mods'
+    )
+
+    is_cavalry = False
+    _FORMATIONS = freeze_formations({}) #formation name -> modifiers, shared read-only by every unit of a type
+
     def __init__(self, initial_position, player, movement_range, formation="Standard") -> None:
 
         """
@@ -45,8 +73,11 @@ class BaseUnit(UnitCombatMixin, UnitMovementMixin, UnitRenderingMixin, UnitForma
         self.has_changed_direction = False
 
         self.formation = formation
+        self.formations = self._FORMATIONS
+        self._formation_mods = None
         self.player = player
         self.movement_range = movement_range
+        self._reachable_cache = None
         self.size = (0, 0)
         self.has_general = False 
         
@@ -57,29 +88,61 @@ class BaseUnit(UnitCombatMixin, UnitMovementMixin, UnitRenderingMixin, UnitForma
         self.base_missile_defense = 0  
         self.attack_type = None
         self.attack_range = 0
+        self.sprite = None
+        self._scaled_sprite = None
+        self._scaled_size = None
         
         self._init_colors()
         self._init_systems()
 
 
+    @property
+    def position(self) -> tuple:
+
+        """
+        The unit's position as a (row, col) tuple.
+        """
+
+        return self._position
+
+    @position.setter
+    def position(self, new_position) -> None:
+
+        """
+        Set the unit's position, keeping the row and column fields in sync.
+
+        Args:
+            new_position (tuple): New position as (row, col).
+        """
+
+        self._position = new_position
+        self._pos_r, self._pos_c = new_position
+
     def _init_colors(self) -> None:
             
             """
             Initialize unit colors based on player.
             """
 
-            if self.player == 1:
-                self.colors = {
-                    'primary': Colors.PLAYER1_PRIMARY,
-                    'secondary': Colors.PLAYER1_SECONDARY,
-                    'hover': Colors.PLAYER1_PRIMARY_HOVER
-                }
-            else:
-                self.colors = {
-                    'primary': Colors.PLAYER2_PRIMARY,
-                    'secondary': Colors.PLAYER2_SECONDARY,
-                    'hover': Colors.PLAYER2_PRIMARY_HOVER
-                }
+            self.colors = _PLAYER1_COLORS if self.player == 1 else _PLAYER2_COLORS
+
+    @staticmethod
+    def _load_shared_sound(sound_path) -> pygame.mixer.Sound:
+
+        """
+        Load a sound effect once and share it between all units that use it.
+
+        Args:
+            sound_path (str): Path to the sound file.
+
+        Returns:
+            pygame.mixer.Sound: The loaded sound.
+        """
+
+        sound = _SOUND_CACHE.get(sound_path)
+        if sound is None:
+            sound = _SOUND_CACHE[sound_path] = pygame.mixer.Sound(sound_path)
+        return sound
 
     def _init_systems(self) -> None:
 
@@ -87,11 +150,11 @@ class BaseUnit(UnitCombatMixin, UnitMovementMixin, UnitRenderingMixin, UnitForma
         Initialize unit systems.
         """
         
+        self.move_sound = None
+        self.attack_sound = None
+        self._audio_enabled = pygame.mixer.get_init() is not None
+
         try:
-            if pygame.mixer.get_init():
-                self.move_sound = None
-                self.attack_sound = None
-            
             self._update_sprite()
             
         except Exception as e:
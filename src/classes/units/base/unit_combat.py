@@ -3,9 +3,109 @@ Combat-related functionality for units.
 """
 
 import random
+import functools
 from .unit_direction import Direction
 
+_random = random.random
+
+# (general_id, unit_type) -> (low, high) damage variation, everyone else gets _DEFAULT_VARIATION
+_DAMAGE_VARIATION = {
+    ('leonidas', 'Hoplite'): (0.95, 1.2), #THIS IS SPARTA
+    ('leonidas', 'Archer'): (0.95, 1.2),
+    ('edward', 'Archer'): (0.92, 1.09), #they have good longbows
+    ('edward', 'MenAtArms'): (0.8, 1.1), #they are stupid
+    ('charlemagne', 'HeavyCavalry'): (0.95, 1.17), #they eat good cheese and drink good wine
+    ('harald', 'Viking'): (0.8, 1.2), #the gods are with them
+    ('harald', 'Archer'): (0.9, 1.2),
+    ('julius', 'Legionary'): (0.95, 1.15), #they eat good pecorino cheese
+}
+_DEFAULT_VARIATION = (0.9, 1.1) #all other mere mortals
+
+_GENERAL_ATTACK_MODS = {
+    ('alexander', 'Hypaspist'): 1.3,
+    ('edward', 'Archer'): 1.05 * 1.25,
+    ('edward', 'MenAtArms'): 1.25,
+    ('charlemagne', 'HeavyCavalry'): 1.35,
+    ('harald', 'Viking'): 1.4,
+    ('harald', 'Archer'): 1.05,
+    ('julius', 'Legionary'): 1.25,
+    ('julius', 'LightHorsemen'): 1.05,
+    ('leonidas', 'Hoplite'): 1.25,
+}
+
+_GENERAL_FORMATION_ATTACK_MODS = {
+    ('alexander', 'Hypaspist', 'Phalanx'): 1.2,
+}
+
+_GENERAL_DEFENSE_MODS = {
+    ('alexander', 'Hypaspist'): 1.1,
+    ('edward', 'Archer'): 1.05,
+    ('charlemagne', 'HeavyCavalry'): 1.05,
+    ('harald', 'Viking'): 1.12,
+    ('julius', 'Legionary'): 1.10,
+    ('leonidas', 'Hoplite'): 1.20,
+}
+
+_DIRECTION_MODS = {"front": 1.0, "flank": 1.5, "rear": 2.0}
+_CRIT_CHANCES = {"front": 0.05, "flank": 0.10, "rear": 0.15}
+_COUNTER_MODS = {"front": 0.6, "flank": 0.4, "rear": 0.2}
+
+def _base_damage(base_attack, attack_mod, direction_mod, target_defense, defense_mod) -> float:
+
+    """
+    Computes the damage of a hit before the random variation is applied.
+
+    Pure arithmetic on plain numbers, shared by attack and compute_attack_preview.
+
+    Args:
+        base_attack (float): The attacker's base attack.
+        attack_mod (float): The attacker's combined attack modifier.
+        direction_mod (float): The flank/rear multiplier for the attack direction.
+        target_defense (float): The target's base defense.
+        defense_mod (float): The target's combined defense modifier.
+
+    Returns:
+        float: The damage dealt, with the defense reduction capped at 90%.
+    """
+
+    defense_reduction = (target_defense * defense_mod) * 0.01
+    if defense_reduction > 0.9:
+        defense_reduction = 0.9
+    return (base_attack * attack_mod * direction_mod) * (1.0 - defense_reduction)
+
+@functools.lru_cache(maxsize=None)
+def _combat_profile(unit_type, general_id, formation) -> tuple:
+
+    """
+    Resolves the general and unit type bonuses for a unit kind once.
+
+    Args:
+        unit_type (str): The unit class name (e.g., "Hoplite").
+        general_id (str | None): The general leading the unit, or None.
+        formation (str): The unit's current formation.
+
+    Returns:
+        tuple: (attack_mod, defense_mod, variation_low, variation_span).
+    """
+
+    attack_mod = (_GENERAL_FORMATION_ATTACK_MODS.get((general_id, unit_type, formation), 1.0)
+                  * _GENERAL_ATTACK_MODS.get((general_id, unit_type), 1.0))
+    defense_mod = _GENERAL_DEFENSE_MODS.get((general_id, unit_type), 1.0)
+    variation_low, variation_high = _DAMAGE_VARIATION.get((general_id, unit_type), _DEFAULT_VARIATION)
+
+    return attack_mod, defense_mod, variation_low, variation_high - variation_low
+
+#(defender facing, sign of the defender's offset from the attacker along the facing axis) -> attack direction
+_ATTACK_DIR_TABLE = {
+    (Direction.NORTH, 1): "rear", (Direction.NORTH, -1): "front", (Direction.NORTH, 0): "flank",
+    (Direction.SOUTH, -1): "rear", (Direction.SOUTH, 1): "front", (Direction.SOUTH, 0): "flank",
+    (Direction.EAST, -1): "rear", (Direction.EAST, 1): "front", (Direction.EAST, 0): "flank",
+    (Direction.WEST, 1): "rear", (Direction.WEST, -1): "front", (Direction.WEST, 0): "flank",
+}
+
 class UnitCombatMixin:
+    __slots__ = ()
+
     def _get_damage_variation(self) -> float:
 
         """
@@ -17,40 +117,20 @@ class UnitCombatMixin:
                   or other specific values depending on the general and unit.
         """
 
-        unit_type = self.__class__.__name__
-        general_id = self.general_id if self.has_general else None
-
-        if general_id == 'leonidas' and (unit_type in ['Hoplite', 'Archer']):
-            return random.uniform(0.95, 1.2) #THIS IS SPARTA
-
-        if general_id == 'alexander':
-            return random.uniform(0.9, 1.1) #normal
+        _, _, variation_low, variation_span = self._get_combat_profile()
+        return variation_low + variation_span * _random()
 
-        if general_id == 'edward':
-            if unit_type == 'Archer':
-                return random.uniform(0.92, 1.09) #they have good longbows
-            if unit_type == 'MenAtArms':
-                return random.uniform(0.8, 1.1) #they are stupid
-            return random.uniform(0.9, 1.1)
+    def _get_combat_profile(self) -> tuple:
 
-        if general_id == 'charlemagne':
-            if unit_type == 'HeavyCavalry':
-                return random.uniform(0.95, 1.17) #they eat good cheese and drink good wine
-            return random.uniform(0.9, 1.1)
-
-        if general_id == 'harald':
-            if unit_type == 'Viking':
-                return random.uniform(0.8, 1.2) #the gods are with them
-            if unit_type == 'Archer':
-                return random.uniform(0.9, 1.2)
-            return random.uniform(0.9, 1.1)
+        """
+        Returns the cached general and unit type bonuses for this unit.
 
-        if general_id == 'julius':
-            if unit_type == 'Legionary':
-                return random.uniform(0.95, 1.15) #they eat good pecorino cheese
-            return random.uniform(0.9, 1.1)
+        Returns:
+            tuple: (attack_mod, defense_mod, variation_low, variation_span).
+        """
 
-        return random.uniform(0.9, 1.1) #all other mere mortals
+        general_id = self.general_id if self.has_general else None
+        return _combat_profile(self.__class__.__name__, general_id, self.formation)
 
     def attack(self, target, board) -> None:
 
@@ -73,19 +153,23 @@ class UnitCombatMixin:
         direction_mod = self._get_direction_modifier(attack_direction)
         crit_chance = self._get_crit_chance(attack_direction)
 
-        attack_mod = self._calculate_attack_modifiers()
-        defense_mod = target._calculate_defense_modifiers(self, board)
-        
-        base_attack = self.base_attack * attack_mod * direction_mod
-        defense_reduction = min(0.9, (target.base_defense * defense_mod) / 100) 
-        base_damage = base_attack * (1 - defense_reduction)  
+        base_damage = _base_damage(self.base_attack, self._calculate_attack_modifiers(), direction_mod,
+                                   target.base_defense, target._calculate_defense_modifiers(self, board))
         
         variation = self._get_damage_variation()
-        if random.random() < crit_chance:
+        if _random() < crit_chance:
             variation *= 1.5 
             
-        final_damage = max(0, base_damage * variation)  
-        target.current_hp = max(0, min(target.max_hp, target.current_hp - final_damage))  
+        final_damage = base_damage * variation
+        if final_damage < 0.0:
+            final_damage = 0.0
+
+        target_hp = target.current_hp - final_damage
+        if target_hp < 0.0:
+            target_hp = 0.0
+        elif target_hp > target.max_hp:
+            target_hp = target.max_hp
+        target.current_hp = target_hp
 
         if self.attack_type == "melee" and target.attack_type == "melee":
             self._handle_counter_attack(target, attack_direction)
@@ -96,10 +180,80 @@ class UnitCombatMixin:
             self.is_alive = False
             
         self.has_attacked = True
-        try:
-            self._play_attack_sound()
-        except Exception as e:
-            print(f"Failed to play attack sound: {str(e)}")
+        self._play_attack_sound()
+
+    @staticmethod
+    def resolve_attacks_batch(attackers, defenders, board) -> list:
+
+        """
+        Resolve several attacks in one call.
+
+        Attacks are resolved in order, so a unit killed by an earlier pair no longer
+        attacks or takes damage in a later one, exactly as if attack had been called
+        for each pair in turn.
+
+        Args:
+            attackers (list): Attacking units.
+            defenders (list): Target units, one for each attacker.
+            board (GameBoard): The game board, which contains the terrain and other state information.
+
+        Returns:
+            list: HP lost by each target, one float per pair.
+        """
+
+        if len(attackers) != len(defenders):
+            raise ValueError("attackers and defenders must have the same length")
+
+        damage_dealt = []
+        append = damage_dealt.append
+        for attacker, target in zip(attackers, defenders):
+            hp_before = target.current_hp
+            attacker.attack(target, board)
+            append(hp_before - target.current_hp)
+
+        return damage_dealt
+
+    def compute_attack_preview(self, target, board) -> tuple:
+
+        """
+        Estimates the outcome of attacking a target without rolling any dice.
+
+        Uses the midpoint of the damage variation, the expected critical hit bonus and
+        the midpoint of the counter-attack variation, so the result is deterministic.
+        Neither unit is modified and no sound is played; use attack()
+        to actually resolve the fight.
+
+        Args:
+            target (BaseUnit): The unit that would be attacked.
+            board (GameBoard): The game board, which contains the terrain.
+
+        Returns:
+            tuple: (attacker_damage, target_damage), the expected HP each unit would lose.
+        """
+
+        if not self.is_alive or not target.is_alive or target.player == self.player:
+            return 0.0, 0.0
+
+        attack_direction = target._get_attack_direction(self)
+        _, _, variation_low, variation_span = self._get_combat_profile()
+        variation = (variation_low + variation_span * 0.5) * (1.0 + 0.5 * _CRIT_CHANCES[attack_direction])
+
+        damage = _base_damage(self.base_attack, self._calculate_attack_modifiers(), _DIRECTION_MODS[attack_direction],
+                              target.base_defense, target._calculate_defense_modifiers(self, board)) * variation
+        if damage < 0.0:
+            damage = 0.0
+
+        counter_damage = 0.0
+        if self.attack_type == "melee" and target.attack_type == "melee":
+            counter_damage = ((target.base_attack * _COUNTER_MODS[attack_direction])
+                              * (1 - (self.base_defense/100)))
+
+        if damage > target.current_hp:
+            damage = target.current_hp
+        if counter_damage > self.current_hp:
+            counter_damage = self.current_hp
+
+        return counter_damage, damage
 
     def _get_direction_modifier(self, attack_direction) -> float:
 
@@ -113,11 +267,7 @@ class UnitCombatMixin:
             float: A multiplier based on the attack direction.
         """
 
-        return {
-            "front": 1.0,
-            "flank": 1.5,
-            "rear": 2.0
-        }[attack_direction]
+        return _DIRECTION_MODS[attack_direction]
 
     def _get_crit_chance(self, attack_direction) -> float:
 
@@ -131,11 +281,7 @@ class UnitCombatMixin:
             float: The chance of a critical hit occurring.
         """
 
-        return {
-            "front": 0.05,
-            "flank": 0.10,
-            "rear": 0.15
-        }[attack_direction]
+        return _CRIT_CHANCES[attack_direction]
 
     def _handle_counter_attack(self, target, attack_direction) -> None:
 
@@ -150,18 +296,17 @@ class UnitCombatMixin:
             attack_direction (str): The direction of the initial attack.
         """
 
-        counter_mod = {
-            "front": 0.6,
-            "flank": 0.4,
-            "rear": 0.2
-        }[attack_direction]
+        counter_mod = _COUNTER_MODS[attack_direction]
         
         counter_base = (target.base_attack * counter_mod) * (1 - (self.base_defense/100))
-        counter_variation = random.uniform(0.8, 1.2)  
+        counter_variation = 0.8 + (1.2 - 0.8) * _random() #same draw as random.uniform(0.8, 1.2)
         counter_damage = counter_base * counter_variation
-        self.current_hp = max(0, self.current_hp - counter_damage)
+        current_hp = self.current_hp - counter_damage
+        if current_hp < 0:
+            current_hp = 0
+        self.current_hp = current_hp
 
-    def can_attack(self, target_position) -> bool:
+    def can_attack(self, target_position, _abs=abs) -> bool:
 
         """
         Check if unit can attack a position.
@@ -176,25 +321,52 @@ class UnitCombatMixin:
         if not self.is_alive:
             return False
                 
-        row, col = self.position
+        row = self._pos_r
+        col = self._pos_c
         target_row, target_col = target_position
-        
-        row_diff = abs(row - target_row)
-        col_diff = abs(col - target_col)
-        
-        return row_diff <= self.attack_range and col_diff <= self.attack_range
+        attack_range = self.attack_range
+
+        return _abs(row - target_row) <= attack_range and _abs(col - target_col) <= attack_range
+
+    def can_attack_many(self, target_positions, _abs=abs) -> list:
+
+        """
+        Check which of several positions the unit can attack.
+
+        Batched form of can_attack for callers that scan many candidate squares,
+        so the unit's position and range are read once instead of per position.
+
+        Args:
+            target_positions (list): Positions to check, each as (row, col)
+
+        Returns:
+            list: One bool per position, True if it is within attack range
+        """
+
+        if not self.is_alive:
+            return [False] * len(target_positions)
+
+        row = self._pos_r
+        col = self._pos_c
+        attack_range = self.attack_range
+
+        return [
+            _abs(row - target_row) <= attack_range and _abs(col - target_col) <= attack_range
+            for target_row, target_col in target_positions
+        ]
     
     def _play_attack_sound(self) -> None:
 
         """
         Play attack sound effect.
+
+        Does nothing when the unit has no attack sound or when the mixer was not
+        initialised at creation time, which is what ``_audio_enabled`` records.
         """
 
-        try:
-            if hasattr(self, 'attack_sound') and self.attack_sound:
-                self.attack_sound.play()
-        except Exception as e:
-            print(f"Failed to play attack sound: {str(e)}")
+        attack_sound = self.attack_sound
+        if attack_sound is not None and self._audio_enabled:
+            attack_sound.play()
 
 
     def _calculate_attack_modifiers(self) -> float:
@@ -206,48 +378,11 @@ class UnitCombatMixin:
             float: The final attack modifier after considering all factors.
         """
 
-        modifiers = 1.0
-        unit_type = self.__class__.__name__
-        general_id = self.general_id if self.has_general else None
-            
-        if general_id == 'alexander' and unit_type == 'Hypaspist':
-            if self.formation == 'Phalanx':
-                modifiers *= 1.2 
-            if self.has_general:
-                modifiers *= 1.3  
-        
-        elif general_id == 'edward':
-            if unit_type == 'Archer':
-                modifiers *= 1.05 
-                if self.has_general:
-                    modifiers *= 1.25 
-            elif unit_type == 'MenAtArms' and self.has_general:
-                modifiers *= 1.25 
-        
-        elif general_id == 'charlemagne' and unit_type == 'HeavyCavalry':
-            if self.has_general:
-                modifiers *= 1.35  
-        
-        elif general_id == 'harald':
-            if unit_type == 'Viking':
-                if self.has_general:
-                    modifiers *= 1.4  
-            elif unit_type == 'Archer':
-                modifiers *= 1.05  
+        modifiers = self._get_combat_profile()[0]
         
-        elif general_id == 'julius':
-            if unit_type == 'Legionary' and self.has_general:
-                modifiers *= 1.25 
-            elif unit_type == 'LightHorsemen':
-                modifiers *= 1.05 
-        
-        elif general_id == 'leonidas' and unit_type == 'Hoplite':
-            if self.has_general:
-                modifiers *= 1.25 
-        
-        if hasattr(self, 'formations') and self.formation in self.formations:
-            formation_mods = self.formations[self.formation]
-            modifiers *= formation_mods['attack_modifier']
+        formation_mods = self._get_formation_mods()
+        if formation_mods is not None:
+            modifiers *= formation_mods[0]
         
         return modifiers
 
@@ -264,35 +399,10 @@ class UnitCombatMixin:
             float: The final defense modifier after considering all factors.
         """
         
-        modifiers = 1.0
-        unit_type = self.__class__.__name__
-        general_id = self.general_id if self.has_general else None
-        
-        if general_id == 'alexander' and unit_type == 'Hypaspist':
-            modifiers *= 1.1  
-        
-        elif general_id == 'edward' and unit_type == 'Archer':
-            if self.has_general:
-                modifiers *= 1.05  
-        
-        elif general_id == 'charlemagne' and unit_type == 'HeavyCavalry':
-            modifiers *= 1.05  
-        
-        elif general_id == 'harald' and unit_type == 'Viking':
-            modifiers *= 1.12 
-        
-        elif general_id == 'julius' and unit_type == 'Legionary':
-            modifiers *= 1.10 
-        
-        elif general_id == 'leonidas' and unit_type == 'Hoplite':
-            modifiers *= 1.20  
-        
-        row, col = self.position
-        terrain = board.terrain.get((row, col))
-        modifiers *= self._get_terrain_modifier(terrain, attacker)
-        modifiers *= self._get_formation_modifier(attacker)
-        
-        return modifiers
+        terrain = board.terrain.get(self.position)
+        return (self._get_combat_profile()[1]
+                * self._get_terrain_modifier(terrain, attacker)
+                * self._get_formation_modifier(attacker))
 
     
     def _get_attack_direction(self, attacker) -> str:
@@ -307,41 +417,10 @@ class UnitCombatMixin:
             str: "front", "flank", or "rear" depending on attack direction
         """
         
-        att_row, att_col = attacker.position
-        def_row, def_col = self.position
-        
-        rel_row = def_row - att_row 
-        rel_col = def_col - att_col  
-        
-        match self.facing_direction:
-            case Direction.NORTH:
-                if rel_row > 0:
-                    return "rear"
-                elif rel_row < 0:  
-                    return "front"
-                else:  
-                    return "flank"
-                    
-            case Direction.SOUTH:
-                if rel_row < 0: 
-                    return "rear"
-                elif rel_row > 0: 
-                    return "front"
-                else:
-                    return "flank"
-                    
-            case Direction.EAST:
-                if rel_col < 0:  
-                    return "rear"
-                elif rel_col > 0: 
-                    return "front"
-                else:
-                    return "flank"
-                    
-            case Direction.WEST:
-                if rel_col > 0: 
-                    return "rear"
-                elif rel_col < 0: 
-                    return "front"
-                else:
-                    return "flank"
\ No newline at end of file
+        facing = self.facing_direction
+        if facing & 1: #East/West face along the columns
+            offset = self._pos_c - attacker._pos_c
+        else:
+            offset = self._pos_r - attacker._pos_r
+
+        return _ATTACK_DIR_TABLE.get((facing, (offset > 0) - (offset < 0)))
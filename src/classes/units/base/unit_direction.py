@@ -4,6 +4,9 @@ Direction handling for units.
 
 from enum import IntEnum
 
+_DIR_NAMES = ("North", "East", "South", "West")
+_DIR_SPRITE_NAMES = ("north", "east", "south", "west")
+
 class Direction(IntEnum):
     NORTH = 0
     EAST = 1
@@ -23,34 +26,45 @@ class Direction(IntEnum):
             str: The string representation of the direction (e.g., "North", "East").
         """
 
-        return {
-            cls.NORTH: "North",
-            cls.EAST: "East", 
-            cls.SOUTH: "South",
-            cls.WEST: "West"
-        }[direction]
+        return _DIR_NAMES[int(direction)]
+
+    @classmethod
+    def to_sprite_name(cls, direction) -> str:
+
+        """
+        Converts a direction enum value to the lowercase name used in sprite file names.
+        
+        Args:
+            direction (Direction): The direction enum value to be converted.
+
+        Returns:
+            str: The lowercase direction name (e.g., "north", "east").
+        """
+
+        return _DIR_SPRITE_NAMES[int(direction)]
     
     @classmethod
-    def get_covered_directions(cls, direction) -> set:
+    def get_covered_directions(cls, direction) -> frozenset:
 
         """
         Returns the set of directions covered by a given direction.
+
+        Units only face the four cardinal directions, so a facing covers itself.
         
         Args:
             direction (Direction): The direction for which to find the covered directions.
         
         Returns:
-            set: A set of directions covered by the given direction (e.g., North-East, South-West).
+            frozenset: A shared, immutable set of the directions covered by the given direction.
         """
 
-        return {
-            cls.NORTH: {cls.NORTH, cls.NORTH_EAST, cls.NORTH_WEST},
-            cls.EAST: {cls.EAST, cls.NORTH_EAST, cls.SOUTH_EAST},
-            cls.SOUTH: {cls.SOUTH, cls.SOUTH_EAST, cls.SOUTH_WEST},
-            cls.WEST: {cls.WEST, cls.NORTH_WEST, cls.SOUTH_WEST}
-        }[direction]
+        return _DIRECTION_COVER[int(direction)]
+
+_DIRECTION_COVER = tuple(frozenset({direction}) for direction in Direction)
 
 class DirectionMixin:
+    __slots__ = ()
+
     def change_direction(self, new_direction) -> bool:
 
         """
@@ -94,4 +108,6 @@ class DirectionMixin:
         
         att_row, att_col = attacker.position
         def_row, def_col = self.position
-        return abs(att_row - def_row) <= abs(att_col - def_col)
\ No newline at end of file
+        row_diff = att_row - def_row
+        col_diff = att_col - def_col
+        return row_diff * row_diff <= col_diff * col_diff #same as comparing abs values, without the calls
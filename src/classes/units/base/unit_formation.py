@@ -2,13 +2,60 @@
 Formation-related functionality for units.
 """
 
-import os
-import pygame
-from ..constants.paths import Paths
-from .unit_direction import Direction
-from ..constants.colors import Colors
+from types import MappingProxyType
+
+#formation -> defense multiplier against ranged attackers
+_RANGED_FORMATION_MODS = {
+    "Spread": 1.2, #extra vs ranged
+    "Turtle": 1.2, #extra vs ranged saporra
+    "Phalanx": 1.2,
+}
+
+#formation -> defense multiplier against melee attackers (Phalanx and Turtle are handled apart)
+_MELEE_FORMATION_MODS = {
+    "Spread": 0.6, #negative melee vs spread
+}
+
+#(frontal, attacker is cavalry) -> Phalanx defense multiplier against melee attackers
+_PHALANX_MELEE_MODS = {
+    (True, True): 3.5, #lapada do satafera vs cavalo
+    (True, False): 2.5, #tapotente
+    (False, True): 0.5, #flank penalty
+    (False, False): 0.5,
+}
+
+#(terrain, attacker attack_type) -> defense multiplier, _TERRAIN_MODS for any other attack type
+_TERRAIN_ATTACK_MODS = {
+    ("mountain", "melee"): 1.5,
+    ("mountain", "ranged"): 1.2,
+    ("forest", "melee"): 1.25,
+    ("forest", "ranged"): 1.7,
+}
+_TERRAIN_MODS = {
+    "mountain": 1.2,
+    "forest": 1.25,
+}
+
+def freeze_formations(formations) -> MappingProxyType:
+
+    """
+    Wraps a formation table and each of its modifier dicts in read-only views.
+
+    Unit types share one table between all their units, so it must not be writable
+    through any single unit.
+
+    Args:
+        formations (dict): Formation name -> {"attack_modifier": ..., "defense_modifier": ...}.
+
+    Returns:
+        MappingProxyType: The read-only formation table.
+    """
+
+    return MappingProxyType({name: MappingProxyType(modifiers) for name, modifiers in formations.items()})
 
 class UnitFormationMixin:
+    __slots__ = ()
+
     def change_formation(self, formation_name) -> None:
 
         """
@@ -23,80 +70,38 @@ class UnitFormationMixin:
 
         """
 
-        if formation_name in self.formations:
+        modifiers = self.formations.get(formation_name)
+        if modifiers is not None:
             self.formation = formation_name
-            modifiers = self.formations[formation_name]
             
             self.attack_points = int(self.base_attack * modifiers['attack_modifier'])
             self.defense_points = int(self.base_defense * modifiers['defense_modifier'])
+            self._formation_mods = (formation_name, self.formations,
+                                    (modifiers['attack_modifier'], modifiers['defense_modifier']))
 
             self._update_sprite()
 
-    def _update_sprite(self) -> None:
+    def _get_formation_mods(self) -> tuple | None:
 
         """
-        Updates the unit's sprite based on its formation and facing direction.
-        
-        This method constructs the appropriate path for the sprite based on the unit's type, 
-        current formation, and direction, then loads and colors the sprite accordingly.
-        """
+        Returns the current formation's (attack_modifier, defense_modifier) pair.
 
-        unit_type = self.__class__.__name__.lower()
-        direction_str = Direction.to_string(self.facing_direction).lower()
-        formation_name = self.formation.lower().replace(" ", "_")
-        
-        sprite_path = self._get_sprite_path(unit_type, formation_name, direction_str)
-        self._load_and_color_sprite(sprite_path)
+        The pair is cached on the unit and rebuilt whenever the formation name or the
+        formations table is replaced, so direct assignments are picked up too.
 
-    def _get_sprite_path(self, unit_type, formation_name, direction_str) -> str:
-
-        """
-        Constructs the path to the unit's sprite based on its type, formation, and direction.
-        
-        Args:
-            unit_type (str): The type of the unit (e.g., "infantry", "cavalry").
-            formation_name (str): The name of the current formation (e.g., "spread", "phalanx").
-            direction_str (str): The string representation of the direction (e.g., "north", "east").
-        
         Returns:
-            str: The file path to the unit's sprite image.
+            tuple | None: The two modifiers, or None if the formation has no entry.
         """
 
-        current_file_path = os.path.dirname(os.path.abspath(__file__))
-        assets_path = os.path.normpath(os.path.join(current_file_path, "..", "..", "..", "assets"))
-        
-        return os.path.join(
-            assets_path,
-            "sprites",
-            "units",
-            unit_type,
-            f"{unit_type}_{formation_name}_{direction_str.lower()}.png"
-        )
-
-    def _load_and_color_sprite(self, sprite_path) -> None:
-
-        """
-        Loads and colors the unit's sprite based on the player's faction.
-        
-        The sprite is loaded from the given path, and a color overlay is applied based on 
-        the player's faction (Player 1 or Player 2).
-        
-        Args:
-            sprite_path (str): The file path to the unit's sprite image.
-        """
-
-        sprite = self._load_sprite(sprite_path)
-        
-        if sprite:
-            self.sprite = sprite.convert_alpha()
-            colored_sprite = self.sprite.copy()
-            
-            overlay = pygame.Surface(self.sprite.get_size()).convert_alpha()
-            overlay.fill(Colors.PLAYER1_PRIMARY_HOVER if self.player == 1 
-                        else Colors.PLAYER2_PRIMARY_HOVER)
-            colored_sprite.blit(overlay, (0,0))
-            
-            self.sprite = colored_sprite
+        formation = self.formation
+        formations = self.formations
+        cached = self._formation_mods
+        if cached is None or cached[0] is not formation or cached[1] is not formations:
+            modifiers = formations.get(formation)
+            if modifiers is not None:
+                modifiers = (modifiers['attack_modifier'], modifiers['defense_modifier'])
+            cached = self._formation_mods = (formation, formations, modifiers)
+        return cached[2]
 
     def _get_formation_modifier(self, attacker) -> float:
 
@@ -112,32 +117,21 @@ class UnitFormationMixin:
             float: The defense modifier based on the formation and the attacker's attack type.
         """
 
-        if not self.formation in self.formations:
+        formation_mods = self._get_formation_mods()
+        if formation_mods is None:
             return 1.0
             
-        formation_mod = self.formations[self.formation]['defense_modifier']
+        formation_mod = formation_mods[1]
         
+        formation = self.formation
         if attacker.attack_type == "ranged":
-            if self.formation == "Spread":
-                return formation_mod * 1.2 #extra vs ranged
-            elif self.formation == "Turtle" or self.formation == "Phalanx":
-                return formation_mod * 1.2  #extra vs ranged saporra
-            return formation_mod
-            
-        else:     
-            if self.formation == "Phalanx":
-                if self._is_frontal_attack(attacker):
-                    if attacker.__class__.__name__ in ["HeavyCavalry", "LightHorsemen"]:
-                        return formation_mod * 3.5  #lapada do satafera vs cavalo
-                    return formation_mod * 2.5  #tapotente
-                return formation_mod * 0.5  #flank penalty
-            
-            elif self.formation == "Spread":
-                return formation_mod * 0.6 #negative melee vs spread
-            
-            elif self.formation == "Turtle":
-                return 1.1 #lil bonus vs melee
-            return formation_mod 
+            return formation_mod * _RANGED_FORMATION_MODS.get(formation, 1.0)
+
+        if formation == "Phalanx":
+            return formation_mod * _PHALANX_MELEE_MODS[(self._is_frontal_attack(attacker), bool(attacker.is_cavalry))]
+        if formation == "Turtle":
+            return 1.1 #lil bonus vs melee
+        return formation_mod * _MELEE_FORMATION_MODS.get(formation, 1.0)
 
 
     def _get_terrain_modifier(self, terrain, attacker) -> float:
@@ -155,12 +149,7 @@ class UnitFormationMixin:
             float: The defense modifier based on the terrain type and attacker's attack type.
         """
         
-        if terrain == "mountain":
-            if attacker.attack_type == "melee":
-                return 1.5
-            return 1.2
-        elif terrain == "forest":
-            if attacker.attack_type == "ranged":
-                return 1.7
-            return 1.25
-        return 1.0
\ No newline at end of file
+        modifier = _TERRAIN_ATTACK_MODS.get((terrain, attacker.attack_type))
+        if modifier is None:
+            return _TERRAIN_MODS.get(terrain, 1.0)
+        return modifier
@@ -3,6 +3,8 @@ Movement-related functionality for units.
 """
 
 class UnitMovementMixin:
+    __slots__ = ()
+
     def move(self, new_position) -> None:
 
         """
@@ -20,6 +22,7 @@ class UnitMovementMixin:
             return
 
         self.position = new_position
+        self._reachable_cache = None
         self._play_move_sound()
 
     def can_move_to(self, position, board, all_units) -> bool:
@@ -29,7 +32,8 @@ class UnitMovementMixin:
 
         This method checks if the target position is within the unit's movement range, 
         and whether the position is occupied by another unit. The unit must be alive 
-        and the position must be reachable on the board.
+        and the position must be reachable on the board. The reachable set is kept 
+        until the unit moves, its movement range changes or a living unit moves or dies.
 
         Args:
             position (tuple): The target position to check, represented as a tuple (row, col).
@@ -43,16 +47,24 @@ class UnitMovementMixin:
         if not self.is_alive:
             return False
 
-        reachable = board.graph.get_reachable_positions(
-            self.position, 
-            self.movement_range
-        )
-        if position not in reachable:
+        graph = board.graph
+        occupied = frozenset(unit.position for unit in all_units if unit.is_alive)
+        key = (self.position, self.movement_range, graph, occupied)
+        cache = self._reachable_cache
+        if cache is None or cache[0] != key:
+            reachable, _ = graph.get_reachable_positions(
+                self.position, 
+                self.movement_range,
+                all_units
+            )
+            cache = self._reachable_cache = (key, frozenset(reachable))
+        if position not in cache[1]:
             return False
 
+        row, col = position
         for unit in all_units:
-            if (unit != self and unit.is_alive and 
-                unit.position == position):
+            if (unit._pos_c == col and unit._pos_r == row and
+                unit is not self and unit.is_alive):
                 return False
 
         return True
@@ -60,10 +72,9 @@ class UnitMovementMixin:
     def _play_move_sound(self) -> None:
 
         """
-        Play movement sound effect.
+        Play movement sound effect, if the unit has one and audio is enabled.
         """
         
-        try:
-            self.move_sound.play()
-        except Exception as e:
-            print(f"Failed to play movement sound: {str(e)}")
\ No newline at end of file
+        move_sound = self.move_sound
+        if move_sound is not None and self._audio_enabled:
+            move_sound.play()
\ No newline at end of file
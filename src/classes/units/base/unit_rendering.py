@@ -4,13 +4,190 @@ Rendering-related functionality for units.
 
 import pygame
 import os
+import functools
 from ..constants.colors import Colors
+from ..constants.paths import Paths
 from ..constants.unit_defaults import UnitDefaults
 from .unit_direction import Direction
-from ..constants.paths import Paths
+
+_ASSETS_PATH = Paths.ASSETS_DIR
+
+@functools.lru_cache(maxsize=256)
+def _sprite_path(unit_type, formation_name, direction_str) -> str:
+
+    """
+    Constructs the path to a unit sprite. Cached, as it only depends on its arguments.
+    
+    Args:
+        unit_type (str): The lowercase unit class name (e.g., "hoplite").
+        formation_name (str): The file name form of the formation (e.g., "shield_wall").
+        direction_str (str): The lowercase direction name (e.g., "north").
+    
+    Returns:
+        str: The file path to the sprite image.
+    """
+
+    return os.path.join(
+        _ASSETS_PATH,
+        "sprites",
+        "units",
+        unit_type,
+        f"{unit_type}_{formation_name}_{direction_str}.png"
+    )
+
+#sprite path -> loaded surface, filled by preload_sprites() or on first load; never drawn on
+SPRITE_REGISTRY = {}
+
+#sprite paths already found missing, so they are not looked up on disk again
+_MISSING_SPRITES = set()
+
+def preload_sprites() -> None:
+
+    """
+    Loads every unit sprite into SPRITE_REGISTRY, keyed by the same path _sprite_path builds.
+
+    Must be called after the display mode is set, since the sprites are converted for it.
+    Unit sprites that are not in the registry are loaded from disk on demand and added to it.
+    """
+
+    units_dir = os.path.join(_ASSETS_PATH, "sprites", "units")
+    if not os.path.isdir(units_dir):
+        print(f"Sprite folder not found at: {units_dir}")
+        return
+
+    for unit_dir in os.scandir(units_dir):
+        if not unit_dir.is_dir():
+            continue
+        for entry in os.scandir(unit_dir.path):
+            if entry.name.endswith(".png"):
+                sprite_path = os.path.join(units_dir, unit_dir.name, entry.name)
+                try:
+                    SPRITE_REGISTRY[sprite_path] = pygame.image.load(sprite_path).convert_alpha()
+                except Exception as e:
+                    print(f"Failed to preload sprite: {str(e)}")
+
+_HEALTH_BAR_BACKGROUND = (64, 64, 64)
+_FLAG_POLE_COLOR = Colors.BORDER
+_UNIT_SCALE = UnitDefaults.UNIT_SCALE
+_HEALTH_COLORS = ((255, 0, 0), (255, 255, 0), (0, 255, 0)) #indexed by the number of thresholds (30%, 70%) exceeded
+
+@functools.lru_cache(maxsize=8)
+def _flag_geometry(unit_width, unit_height) -> tuple:
+
+    """
+    Returns the general's flag measurements for a unit size.
+
+    Args:
+        unit_width (float): Width of the unit on screen.
+        unit_height (float): Height of the unit on screen.
+
+    Returns:
+        tuple: (x_offset, flag_width, flag_height, pole_width, tip_y_offset, bottom_y_offset),
+               offsets relative to the flag's top-left corner except x_offset, which is relative to the unit.
+    """
+
+    flag_height = unit_height * 0.3
+    flag_width = unit_width * 0.4
+    pole_width = flag_width * 0.1
+
+    return (unit_width - flag_width) / 2, flag_width, flag_height, pole_width, flag_height * 0.3, flag_height * 0.6
+
+@functools.lru_cache(maxsize=32)
+def _tint_overlay(size, rgba) -> pygame.Surface:
+
+    """
+    Returns the shared player-color overlay for a sprite size.
+
+    Args:
+        size (tuple): Width and height of the sprite.
+        rgba (tuple): Overlay color with alpha.
+
+    Returns:
+        pygame.Surface: Filled overlay surface, shared between units and never mutated.
+    """
+
+    overlay = pygame.Surface(size).convert_alpha()
+    overlay.fill(rgba)
+    return overlay
+
+def _flush_blits(screen, batch) -> None:
+
+    """
+    Blits and empties a queue of pending (surface, position) pairs in one call.
+
+    Args:
+        screen (pygame.Surface): Surface to draw on
+        batch (list | None): The pending blits; None means nothing is being batched.
+    """
+
+    if batch:
+        screen.blits(batch, doreturn=False)
+        batch.clear()
+
+class RenderContext:
+
+    """
+    Per-frame unit geometry shared by every unit drawn on the same surface.
+
+    Attributes:
+        square_width (int): Width of a board square in pixels.
+        square_height (int): Height of a board square in pixels.
+        margin (float): Offset of a unit inside its square.
+        unit_width (float): Width of a unit on screen.
+        unit_height (float): Height of a unit on screen.
+    """
+
+    __slots__ = ('square_width', 'square_height', 'margin', 'unit_width', 'unit_height')
+
+    def __init__(self, square_width, square_height) -> None:
+
+        """
+        Initialize the context from the size of a board square.
+
+        Args:
+            square_width (int): Width of a board square in pixels.
+            square_height (int): Height of a board square in pixels.
+        """
+
+        self.square_width = square_width
+        self.square_height = square_height
+        self.margin = square_width * (1 - _UNIT_SCALE) / 2
+        self.unit_width = square_width * _UNIT_SCALE
+        self.unit_height = square_height * _UNIT_SCALE
+
+    @classmethod
+    def from_board(cls, screen, board) -> 'RenderContext':
+
+        """
+        Builds the context for drawing the board's units on a surface.
+
+        Args:
+            screen (pygame.Surface): Surface the units will be drawn on
+            board (Board): Board instance
+
+        Returns:
+            RenderContext: The geometry for this surface and board.
+
+        Raises:
+            ValueError: If the surface has no area.
+        """
+
+        width, height = screen.get_size()
+        if width <= 0 or height <= 0:
+            raise ValueError("Invalid screen dimensions")
+
+        return cls(width // board.n, height // board.m)
 
 class UnitRenderingMixin:
-    def draw(self, screen, board) -> None:
+    __slots__ = ()
+
+    #(unit class, formation, facing direction, player) -> colored sprite, shared between units
+    _SPRITE_CACHE = {}
+
+    #(colored sprite, size) -> scaled sprite, shared by every unit showing that sprite
+    _SCALED_CACHE = {}
+
+    def draw(self, screen, board, context=None, batch=None) -> None:
 
         """
         Draw unit on the screen.
@@ -18,37 +195,77 @@ class UnitRenderingMixin:
         Args:
             screen (pygame.Surface): Surface to draw the unit on
             board (Board): Board instance
+            context (RenderContext, optional): Geometry shared by all units this frame,
+                computed from the screen and board when omitted.
+            batch (list, optional): Pending (surface, position) blits shared between units. When given,
+                the sprite is queued instead of blitted, and the queue is flushed before any shape is
+                drawn so the drawing order is unchanged. The caller flushes what is left with Surface.blits.
         """
 
         if not self.is_alive:
             return
 
-        try:
-            width, height = screen.get_size()
-            if width <= 0 or height <= 0:
-                raise ValueError("Invalid screen dimensions")
+        if context is None:
+            context = RenderContext.from_board(screen, board)
 
-            square_width = width // board.n
-            square_height = height // board.m
-            self.size = (square_width, square_height)
+        square_width = context.square_width
+        square_height = context.square_height
+        self.size = (square_width, square_height)
 
-            margin = square_width * (1 - UnitDefaults.UNIT_SCALE) / 2
-            unit_width = square_width * UnitDefaults.UNIT_SCALE
-            unit_height = square_height * UnitDefaults.UNIT_SCALE
-            
-            x = self.position[1] * square_width + margin
-            y = self.position[0] * square_height + margin
+        margin = context.margin
+        unit_width = context.unit_width
+        unit_height = context.unit_height
+        
+        x = self._pos_c * square_width + margin
+        y = self._pos_r * square_height + margin
 
-            if board.selected_square == self.position:
-                self.draw_health_bar(screen, x, y, unit_width, unit_height)
+        if board.selected_square == self.position:
+            _flush_blits(screen, batch)
+            self.draw_health_bar(screen, x, y, unit_width, unit_height)
 
-            if hasattr(self, 'sprite') and self.sprite is not None:
+        if self.sprite is not None:
+            if batch is None:
                 self._draw_sprite(screen, x, y, unit_width, unit_height)
+            else:
+                batch.append((self._get_scaled_sprite(unit_width, unit_height), (x, y)))
 
+        if self.has_general:
+            _flush_blits(screen, batch)
             self._draw_general_flag(screen, x, y, unit_width, unit_height)
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to draw unit: {str(e)}")
+    @classmethod
+    def draw_batch(cls, units, screen, board) -> None:
+
+        """
+        Draw several units on the same surface.
+
+        The geometry is computed once for all units and their sprites are queued
+        and drawn with Surface.blits, giving the same pixels as calling draw on
+        each unit in turn.
+
+        Args:
+            units (list): Units to draw; dead units are skipped
+            screen (pygame.Surface): Surface to draw the units on
+            board (Board): Board instance
+        """
+
+        context = RenderContext.from_board(screen, board)
+        batch = []
+        for unit in units:
+            if unit.is_alive:
+                unit.draw(screen, board, context, batch)
+        _flush_blits(screen, batch)
+
+    def render_state(self) -> tuple:
+
+        """
+        Returns everything that affects how the unit is drawn, for change detection.
+
+        Returns:
+            tuple: (position, is_alive, current_hp, sprite, has_general). The sprite is compared by identity.
+        """
+
+        return self.position, self.is_alive, self.current_hp, self.sprite, self.has_general
 
     def _draw_sprite(self, screen, x, y, width, height) -> None:
 
@@ -63,23 +280,59 @@ class UnitRenderingMixin:
             height (int): Height of the sprite
         """
 
-        try:
-            resized_sprite = pygame.transform.scale(self.sprite, (width, height))
-            screen.blit(resized_sprite, (x, y))
-        except Exception as e:
-            print(f"Failed to draw sprite: {e}")
+        screen.blit(self._get_scaled_sprite(width, height), (x, y))
+
+    def _get_scaled_sprite(self, width, height) -> pygame.Surface:
+
+        """
+        Returns the sprite scaled to the given size, reusing the last scaled copy
+        until the size or the sprite itself changes.
+
+        Units showing the same cached sprite share one scaled copy, so each distinct
+        sprite is scaled once per size rather than once per unit.
+
+        Args:
+            width (int): Width of the sprite
+            height (int): Height of the sprite
+        """
+
+        size = (width, height)
+        resized_sprite = self._scaled_sprite
+        if resized_sprite is None or self._scaled_size != size:
+            scaled_cache = self._SCALED_CACHE
+            key = (self.sprite, size)
+            resized_sprite = scaled_cache.get(key)
+            if resized_sprite is None:
+                if scaled_cache and next(iter(scaled_cache))[1] != size:
+                    scaled_cache.clear() #board was resized, old sizes won't come back soon
+                resized_sprite = scaled_cache[key] = pygame.transform.scale(self.sprite, size)
+            self._scaled_sprite = resized_sprite
+            self._scaled_size = size
+        return resized_sprite
     
     def _load_sprite(self, sprite_path) -> pygame.Surface | None:
 
-        """Load sprite from the given path.
+        """Load sprite from the given path, preferring the preloaded registry.
+
+        The returned surface is already in display format and owned by the caller,
+        so it can be drawn on without affecting the registry. A path that was not
+        found is remembered and not looked up on disk again.
         
         Args:
             sprite_path (str): The path to the sprite image file.
         """
 
+        sprite = SPRITE_REGISTRY.get(sprite_path)
+        if sprite is not None:
+            return sprite.copy()
+        if sprite_path in _MISSING_SPRITES:
+            return None
+
         try:
             if os.path.exists(sprite_path):
-                return pygame.image.load(sprite_path)
+                sprite = SPRITE_REGISTRY[sprite_path] = pygame.image.load(sprite_path).convert_alpha()
+                return sprite.copy()
+            _MISSING_SPRITES.add(sprite_path)
             print(f"Sprite not found at: {sprite_path}")
             return None
         except Exception as e:
@@ -92,31 +345,29 @@ class UnitRenderingMixin:
         
         This method constructs the appropriate path for the sprite based on the unit's type, 
         current formation, and direction, then loads and colors the sprite accordingly.
+        Colored sprites are cached per type, formation, direction and player.
         """
 
+        self._scaled_sprite = None
+
         try:
+            cache_key = (self.__class__, self.formation, self.facing_direction, self.player)
+            cached = self._SPRITE_CACHE.get(cache_key)
+            if cached is not None:
+                self.sprite = cached
+                return
+
             unit_type = self.__class__.__name__.lower()
-            direction_str = Direction.to_string(self.facing_direction).lower()
+            direction_str = Direction.to_sprite_name(self.facing_direction)
             formation_name = self.formation.lower().replace(" ", "_")
             
-            sprite_path = os.path.join(
-                Paths.SPRITES_DIR,
-                'units',
-                unit_type,
-                f"{unit_type}_{formation_name}_{direction_str}.png"
-            )
+            sprite_path = _sprite_path(unit_type, formation_name, direction_str)
             
             sprite = self._load_sprite(sprite_path)
             if sprite:
-                self.sprite = sprite.convert_alpha()
-                if hasattr(self, 'colors'):
-                    colored_sprite = self.sprite.copy()
-                    overlay = pygame.Surface(self.sprite.get_size()).convert_alpha()
-                    overlay.fill(self.colors['hover'])
-                    colored_sprite.blit(overlay, (0,0))
-                    self.sprite = colored_sprite
-            else:
-                print(f"Failed to load sprite for {unit_type} with formation {formation_name}")
+                self.sprite = sprite
+                sprite.blit(_tint_overlay(sprite.get_size(), self.colors['hover']), (0,0))
+                self._SPRITE_CACHE[cache_key] = sprite
                 
         except Exception as e:
             print(f"Failed to update sprite: {str(e)}")
@@ -148,15 +399,13 @@ class UnitRenderingMixin:
             bar_x = unit_x + unit_width + 5
         bar_y = unit_y + (unit_height - bar_height) / 2
 
-        pygame.draw.rect(screen, (64, 64, 64), 
+        pygame.draw.rect(screen, _HEALTH_BAR_BACKGROUND, 
                         (bar_x, bar_y, bar_width, bar_height))
         
         filled_height = bar_height * health_percentage
         filled_y = bar_y + (bar_height - filled_height)
         
-        color = (0, 255, 0) if health_percentage > 0.7 else \
-                (255, 255, 0) if health_percentage > 0.3 else \
-                (255, 0, 0)
+        color = _HEALTH_COLORS[(health_percentage > 0.3) + (health_percentage > 0.7)]
                 
         pygame.draw.rect(screen, color, 
                         (bar_x, filled_y, bar_width, filled_height))
@@ -177,19 +426,17 @@ class UnitRenderingMixin:
         if not self.has_general:
             return
             
-        flag_height = unit_height * 0.3
-        flag_width = unit_width * 0.4
-        pole_width = flag_width * 0.1
+        x_offset, flag_width, flag_height, pole_width, tip_offset, bottom_offset = _flag_geometry(unit_width, unit_height)
         
-        flag_x = x + (unit_width - flag_width) / 2
+        flag_x = x + x_offset
         flag_y = y - flag_height
-        pygame.draw.rect(screen, Colors.BORDER,
+        pygame.draw.rect(screen, _FLAG_POLE_COLOR,
                         (flag_x, flag_y, pole_width, flag_height))
         
-        flag_color = Colors.PLAYER1_PRIMARY if self.player == 1 else Colors.PLAYER2_PRIMARY
-        flag_points = [
+        flag_color = self.colors['primary']
+        flag_points = (
             (flag_x + pole_width, flag_y),
-            (flag_x + flag_width, flag_y + flag_height * 0.3),
-            (flag_x + pole_width, flag_y + flag_height * 0.6)
-        ]
+            (flag_x + flag_width, flag_y + tip_offset),
+            (flag_x + pole_width, flag_y + bottom_offset)
+        )
         pygame.draw.polygon(screen, flag_color, flag_points)
\ No newline at end of file
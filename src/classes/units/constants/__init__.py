@@ -11,7 +11,7 @@ from .unit_defaults import UnitDefaults
 # Export all constants classes for easy access
 __all__ = [
     'Colors',
-    'Formations',
+    'Armies',
     'Maps',
     'Paths',
     'UnitDefaults'
@@ -1,3 +1,11 @@
+def _pack(terrain_map) -> tuple:
+
+    """
+    Strip a multiline map string into a tuple of row strings, one per board row.
+    """
+
+    return tuple(row.strip() for row in terrain_map.strip().splitlines())
+
 class Maps:
     """
     Class to store maps for the game.
@@ -24,4 +32,5 @@ class Maps:
             #xx#x.#.##.#####.###x########.
             #x#####.####x.#xx##x.##.#.####
             #.##.########.#####..#####x##x'''
-    
+
+    MAP1_ROWS = _pack(map1)
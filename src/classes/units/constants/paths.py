@@ -4,9 +4,12 @@ class Paths:
 
     """
     Paths to assets used for rendering units.
+
+    Paths are absolute, resolved from this file's location, so they do not
+    depend on the working directory the game is started from.
     """
     
-    ASSETS_DIR = os.path.join('..', 'assets')
+    ASSETS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', '..', 'assets'))
     SPRITES_DIR = os.path.join(ASSETS_DIR, 'sprites')
     
     # Terrain sprites
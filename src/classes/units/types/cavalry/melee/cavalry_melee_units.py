@@ -3,11 +3,28 @@ Melee Cavalry unit type implementations.
 """
 
 from ....base.base_unit import BaseUnit
-import pygame
+from ....base.unit_formation import freeze_formations
 import os
 from ....constants.paths import Paths
 
 class LightHorsemen(BaseUnit):
+    __slots__ = ()
+    is_cavalry = True
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Spread": {
+            "attack_modifier": 0.9,
+            "defense_modifier": 1.2 #against ranged
+        },
+        "V": {
+            "attack_modifier": 1.5,
+            "defense_modifier": 0.6
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """
@@ -31,21 +48,6 @@ class LightHorsemen(BaseUnit):
         self.base_attack = 50
         self.base_defense = 10
         self.base_missile_defense = 25
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Spread": {
-                "attack_modifier": 0.9,
-                "defense_modifier": 1.2 #against ranged
-            },
-            "V": {
-                "attack_modifier": 1.5,
-                "defense_modifier": 0.6
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -57,8 +59,8 @@ class LightHorsemen(BaseUnit):
         Load sounds for light cavalry.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'lighthorsemen_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'lighthorsemen_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'lighthorsemen_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'lighthorsemen_attack.wav'))
 
     def _update_stats(self) -> None:
 
@@ -72,6 +74,23 @@ class LightHorsemen(BaseUnit):
         self.current_hp = self.max_hp
 
 class HeavyCavalry(BaseUnit):
+    __slots__ = ()
+    is_cavalry = True
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Spread": {
+            "attack_modifier": 0.9,
+            "defense_modifier": 1.2 #against ranged
+        },
+        "V": {
+            "attack_modifier": 1.5,
+            "defense_modifier": 0.6
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """
@@ -95,21 +114,6 @@ class HeavyCavalry(BaseUnit):
         self.base_attack = 65
         self.base_defense = 30
         self.base_missile_defense = 35
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Spread": {
-                "attack_modifier": 0.9,
-                "defense_modifier": 1.2 #against ranged
-            },
-            "V": {
-                "attack_modifier": 1.5,
-                "defense_modifier": 0.6
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -121,8 +125,8 @@ class HeavyCavalry(BaseUnit):
         Load sounds for heavy cavalry.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'heavycavalry_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'heavycavalry_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'heavycavalry_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'heavycavalry_attack.wav'))
 
     def _update_stats(self) -> None:
         
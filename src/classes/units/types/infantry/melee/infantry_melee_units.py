@@ -3,12 +3,32 @@ Melee Infantry unit type implementations.
 """
 
 from ....base.base_unit import BaseUnit
-import pygame
+from ....base.unit_formation import freeze_formations
 import os
 from ....constants.paths import Paths
 from ....base.unit_combat import UnitCombatMixin
 
 class Hoplite(BaseUnit):
+    __slots__ = ()
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Shield Wall": {
+            "attack_modifier": 0.7,
+            "defense_modifier": 1.8
+        },
+        "Phalanx": {
+            "attack_modifier": 1.2,
+            "defense_modifier": 1.6
+        },
+        "Spread": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0 #ranged will get bonus
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """
@@ -32,25 +52,6 @@ class Hoplite(BaseUnit):
         self.base_attack = 60
         self.base_defense = 20
         self.base_missile_defense = 13
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Shield Wall": {
-                "attack_modifier": 0.7,
-                "defense_modifier": 1.8
-            },
-            "Phalanx": {
-                "attack_modifier": 1.2,
-                "defense_modifier": 1.6
-            },
-            "Spread": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0 #ranged will get bonus
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -62,8 +63,8 @@ class Hoplite(BaseUnit):
         Load sounds for hoplite.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'hoplite_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'hoplite_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'hoplite_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'hoplite_attack.wav'))
 
     def _update_stats(self) -> None:
 
@@ -77,6 +78,26 @@ class Hoplite(BaseUnit):
         self.current_hp = self.max_hp
 
 class Legionary(BaseUnit):
+    __slots__ = ()
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Shield Wall": {
+            "attack_modifier": 0.7,
+            "defense_modifier": 1.8
+        },
+        "Turtle": {
+            "attack_modifier": 0.5,
+            "defense_modifier": 1.2 #ranged will get bonus
+        },
+        "Spread": {
+            "attack_modifier": 0.9,
+            "defense_modifier": 1.0 #ranged will get bonus
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """
@@ -100,25 +121,6 @@ class Legionary(BaseUnit):
         self.base_attack = 50
         self.base_defense = 22
         self.base_missile_defense = 15
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Shield Wall": {
-                "attack_modifier": 0.7,
-                "defense_modifier": 1.8
-            },
-            "Turtle": {
-                "attack_modifier": 0.5,
-                "defense_modifier": 1.2 #ranged will get bonus
-            },
-            "Spread": {
-                "attack_modifier": 0.9,
-                "defense_modifier": 1.0 #ranged will get bonus
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -130,8 +132,8 @@ class Legionary(BaseUnit):
         Load sounds for legionary.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'legionary_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'legionary_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'legionary_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'legionary_attack.wav'))
 
     def _update_stats(self) -> None:
 
@@ -145,6 +147,30 @@ class Legionary(BaseUnit):
         self.current_hp = self.max_hp
 
 class Viking(BaseUnit):
+    __slots__ = ()
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Shield Wall": {
+            "attack_modifier": 0.7,
+            "defense_modifier": 1.8
+        },
+        "Spread": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0 #ranged will get bonus
+        },
+        "Turtle": {
+            "attack_modifier": 0.5,
+            "defense_modifier": 1.2
+        },
+        "V": {
+            "attack_modifier": 1.5, #berserkergang uga buga
+            "defense_modifier": 0.9
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """   
@@ -168,29 +194,6 @@ class Viking(BaseUnit):
         self.base_attack = 65
         self.base_defense = 15
         self.base_missile_defense = 15
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Shield Wall": {
-                "attack_modifier": 0.7,
-                "defense_modifier": 1.8
-            },
-            "Spread": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0 #ranged will get bonus
-            },
-            "Turtle": {
-                "attack_modifier": 0.5,
-                "defense_modifier": 1.2
-            },
-            "V": {
-                "attack_modifier": 1.5, #berserkergang uga buga
-                "defense_modifier": 0.9
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -202,8 +205,8 @@ class Viking(BaseUnit):
         Load sounds for viking.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'viking_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'viking_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'viking_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'viking_attack.wav'))
 
     def _update_stats(self) -> None:
 
@@ -217,6 +220,22 @@ class Viking(BaseUnit):
         self.current_hp = self.max_hp
 
 class Hypaspist(BaseUnit):
+    __slots__ = ()
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Phalanx": {
+            "attack_modifier": 1.2,
+            "defense_modifier": 1.6
+        },
+        "Spread": {
+            "attack_modifier": 0.9,
+            "defense_modifier": 1.0 #ranged will get bonus
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """
@@ -240,21 +259,6 @@ class Hypaspist(BaseUnit):
         self.base_attack = 45
         self.base_defense = 25
         self.base_missile_defense = 15
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Phalanx": {
-                "attack_modifier": 1.2,
-                "defense_modifier": 1.6
-            },
-            "Spread": {
-                "attack_modifier": 0.9,
-                "defense_modifier": 1.0 #ranged will get bonus
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -266,8 +270,8 @@ class Hypaspist(BaseUnit):
         Load sounds for hypaspist.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'hypaspist_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'hypaspist_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'hypaspist_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'hypaspist_attack.wav'))
 
     def _update_stats(self) -> None:
 
@@ -281,6 +285,30 @@ class Hypaspist(BaseUnit):
         self.current_hp = self.max_hp
 
 class MenAtArms(BaseUnit):
+    __slots__ = ()
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Shield Wall": {
+            "attack_modifier": 0.7,
+            "defense_modifier": 1.8
+        },
+        "V": {
+            "attack_modifier": 1.5,
+            "defense_modifier": 0.6
+        },
+        "Turtle": {
+            "attack_modifier": 0.5,
+            "defense_modifier": 1.2 #ranged will get bonus
+        },
+        "Spread": {
+            "attack_modifier": 0.9,
+            "defense_modifier": 1.0 #ranged will get bonus
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """
@@ -304,29 +332,6 @@ class MenAtArms(BaseUnit):
         self.base_attack = 50
         self.base_defense = 35
         self.base_missile_defense = 25
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Shield Wall": {
-                "attack_modifier": 0.7,
-                "defense_modifier": 1.8
-            },
-            "V": {
-                "attack_modifier": 1.5,
-                "defense_modifier": 0.6
-            },
-            "Turtle": {
-                "attack_modifier": 0.5,
-                "defense_modifier": 1.2 #ranged will get bonus
-            },
-            "Spread": {
-                "attack_modifier": 0.9,
-                "defense_modifier": 1.0 #ranged will get bonus
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -338,8 +343,8 @@ class MenAtArms(BaseUnit):
         Load sounds for men at arms.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'menatarms_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'menatarms_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'menatarms_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'menatarms_attack.wav'))
 
     def _update_stats(self) -> None:
 
@@ -3,11 +3,23 @@ Ranged Infantry unit type implementations.
 """
 
 from ....base.base_unit import BaseUnit
-import pygame
+from ....base.unit_formation import freeze_formations
 import os
 from ....constants.paths import Paths
 
 class Archer(BaseUnit):
+    __slots__ = ()
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Spread": {
+            "attack_modifier": 1.3,
+            "defense_modifier": 0.8
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
         
         """
@@ -31,17 +43,6 @@ class Archer(BaseUnit):
         self.base_defense = 2 
         self.attack_range = 2
         self.base_missile_defense = 8
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Spread": {
-                "attack_modifier": 1.3,
-                "defense_modifier": 0.8
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -53,8 +54,8 @@ class Archer(BaseUnit):
         Load sounds for archer.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'archer_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'archer_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'archer_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'archer_attack.wav'))
 
     def _update_stats(self) -> None:
 
@@ -68,6 +69,18 @@ class Archer(BaseUnit):
         self.defense_points = self.base_defense
 
 class Crossbowmen(BaseUnit):
+    __slots__ = ()
+    _FORMATIONS = freeze_formations({
+        "Standard": {
+            "attack_modifier": 1.0,
+            "defense_modifier": 1.0
+        },
+        "Spread": {
+            "attack_modifier": 1.3,
+            "defense_modifier": 0.8
+        }
+    })
+
     def __init__(self, initial_position, player, formation="Standard") -> None:
 
         """
@@ -91,17 +104,6 @@ class Crossbowmen(BaseUnit):
         self.base_defense = 2 
         self.attack_range = 3
         self.base_missile_defense = 8
-        
-        self.formations = {
-            "Standard": {
-                "attack_modifier": 1.0,
-                "defense_modifier": 1.0
-            },
-            "Spread": {
-                "attack_modifier": 1.3,
-                "defense_modifier": 0.8
-            }
-        }
 
         self._load_sounds()
         self._update_stats()
@@ -113,8 +115,8 @@ class Crossbowmen(BaseUnit):
         Load sounds for crossbowmen.
         """
 
-        self.move_sound = pygame.mixer.Sound(os.path.join(Paths.MOVE_SOUND_DIR, 'crossbowman_movement.wav'))
-        self.attack_sound = pygame.mixer.Sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'crossbowman_attack.wav'))
+        self.move_sound = self._load_shared_sound(os.path.join(Paths.MOVE_SOUND_DIR, 'crossbowman_movement.wav'))
+        self.attack_sound = self._load_shared_sound(os.path.join(Paths.ATTACK_SOUND_DIR, 'crossbowman_attack.wav'))
 
     def _update_stats(self) -> None:
 
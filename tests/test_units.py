@@ -1,12 +1,15 @@
 import unittest
 import random
-from unittest.mock import MagicMock
+import pygame
+from unittest.mock import MagicMock, patch
 
 import sys
 sys.path.append("../src")
 
 from classes.units.base.unit_direction import Direction
 from classes.units.base.base_unit import BaseUnit
+from classes.graph import BoardGraph
+from classes.units.types.infantry.melee.infantry_melee_units import Hoplite
 
 class TestUnitComponents(unittest.TestCase):
     def setUp(self) -> None:
@@ -52,24 +55,73 @@ class TestUnitComponents(unittest.TestCase):
         with self.assertRaises(ValueError):
             BaseUnit((5, 5), player=1, movement_range=-1)
 
+    def test_unit_uses_slots(self) -> None:
+
+        """
+        Test that units store their attributes in slots.
+        Verifies that no per-instance __dict__ is allocated.
+        """
+
+        unit = BaseUnit((5, 5), player=1, movement_range=3)
+
+        self.assertFalse(hasattr(unit, '__dict__'))
+        with self.assertRaises(AttributeError):
+            unit.not_a_unit_attribute = True
+
+    def test_formation_tables_are_read_only(self) -> None:
+
+        """
+        Test that the formation tables shared by a unit type cannot be written through a unit.
+        """
+
+        with patch.object(BaseUnit, '_load_shared_sound', return_value=None):
+            hoplites = [Hoplite((5, 5), player=1), Hoplite((6, 5), player=2)]
+        unit = BaseUnit((5, 5), player=1, movement_range=3)
+
+        self.assertIs(hoplites[0].formations, hoplites[1].formations)
+        with self.assertRaises(TypeError):
+            hoplites[0].formations["Phalanx"]["defense_modifier"] = 10.0
+        with self.assertRaises(TypeError):
+            unit.formations["Standard"] = {}
+        self.assertEqual(len(BaseUnit((6, 6), player=2, movement_range=3).formations), 0)
+
     def test_can_move_to(self) -> None:
 
         """
         Test unit movement validation.
-        Verifies that a unit can only move to reachable, unoccupied positions.
+        Verifies that a unit can only move to reachable, unoccupied positions,
+        and that the cached reachable set follows the other units.
         """
         
-        board = MagicMock()
-        board.graph.get_reachable_positions.return_value = {(6, 5), (4, 5), (5, 6), (5, 4)}
+        board = MagicMock(spec=['graph'])
+        terrain = {(row, col): "plains" for row in range(10) for col in range(10)}
 
         unit = BaseUnit((5, 5), player=1, movement_range=1)
         other_unit = BaseUnit((6, 5), player=2, movement_range=1)
         
         all_units = [unit, other_unit]
+        board.graph = BoardGraph(10, 10, terrain, all_units)
 
-        self.assertTrue(unit.can_move_to((5, 6), board, all_units))
-        self.assertFalse(unit.can_move_to((6, 5), board, all_units))
-        self.assertFalse(unit.can_move_to((7, 5), board, all_units))
+        with patch.object(board.graph, 'get_reachable_positions', wraps=board.graph.get_reachable_positions) as reachable:
+            self.assertTrue(unit.can_move_to((5, 6), board, all_units))
+            self.assertFalse(unit.can_move_to((6, 5), board, all_units))
+            self.assertFalse(unit.can_move_to((7, 5), board, all_units))
+            self.assertEqual(reachable.call_count, 1)
+
+            other_unit.move((8, 8))
+            self.assertTrue(unit.can_move_to((6, 5), board, all_units))
+            self.assertEqual(reachable.call_count, 2)
+
+            other_unit.move((4, 5))
+            self.assertFalse(unit.can_move_to((4, 5), board, all_units))
+            other_unit.is_alive = False
+            self.assertTrue(unit.can_move_to((4, 5), board, all_units))
+            self.assertEqual(reachable.call_count, 4)
+
+            unit.move((5, 6))
+            self.assertTrue(unit.can_move_to((5, 7), board, all_units))
+            self.assertFalse(unit.can_move_to((5, 4), board, all_units))
+            self.assertEqual(reachable.call_count, 5)
 
     def test_attack_direction_calculation(self) -> None:
 
@@ -90,6 +142,167 @@ class TestUnitComponents(unittest.TestCase):
         attacker_flank = BaseUnit((5, 6), player=2, movement_range=3)
         self.assertEqual(defender._get_attack_direction(attacker_flank), "flank")
 
+    def test_can_attack_many(self) -> None:
+
+        """
+        Test batched attack range checks.
+        Verify that can_attack_many agrees with can_attack for every position.
+        """
+
+        unit = BaseUnit((5, 5), player=1, movement_range=3)
+        unit.attack_range = 2
+
+        positions = [(5, 5), (7, 7), (3, 6), (8, 5), (5, 2), (0, 0)]
+        expected = [unit.can_attack(pos) for pos in positions]
+
+        self.assertEqual(unit.can_attack_many(positions), expected)
+        self.assertEqual(expected, [True, True, True, False, False, False])
+
+        unit.is_alive = False
+        self.assertEqual(unit.can_attack_many(positions), [False] * len(positions))
+
+    def test_batched_draw_matches_direct_draw(self) -> None:
+
+        """
+        Test batched unit drawing.
+        Verify that queueing sprites for Surface.blits, by hand or through draw_batch,
+        gives the same pixels as blitting each unit.
+        """
+
+        board = MagicMock()
+        board.n, board.m = 4, 4
+        board.selected_square = (1, 1)
+
+        units = []
+        for position, color in [((1, 1), (200, 0, 0, 255)), ((2, 1), (0, 200, 0, 255)), ((1, 2), (0, 0, 200, 255))]:
+            unit = BaseUnit(position, player=1, movement_range=1)
+            unit.sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
+            unit.sprite.fill(color)
+            units.append(unit)
+        units[1].has_general = True
+
+        direct = pygame.Surface((200, 200), pygame.SRCALPHA)
+        for unit in units:
+            unit.draw(direct, board)
+
+        batched = pygame.Surface((200, 200), pygame.SRCALPHA)
+        batch = []
+        for unit in units:
+            unit.draw(batched, board, None, batch)
+        batched.blits(batch)
+
+        self.assertEqual(pygame.image.tostring(direct, 'RGBA'), pygame.image.tostring(batched, 'RGBA'))
+
+        dead = BaseUnit((3, 3), player=1, movement_range=1)
+        dead.sprite = units[0].sprite
+        dead.is_alive = False
+
+        grouped = pygame.Surface((200, 200), pygame.SRCALPHA)
+        BaseUnit.draw_batch(units + [dead], grouped, board)
+
+        self.assertEqual(pygame.image.tostring(direct, 'RGBA'), pygame.image.tostring(grouped, 'RGBA'))
+
+    def test_leonidas_defense_bonus(self) -> None:
+
+        """
+        Test the Leonidas defense bonus for hoplites.
+        Verify it depends only on the defender's own general and never scans board units.
+        """
+
+        with patch.object(BaseUnit, '_load_shared_sound', return_value=None):
+            defender = Hoplite((5, 5), player=1)
+        attacker = BaseUnit((5, 6), player=2, movement_range=2)
+        attacker.attack_type = "melee"
+
+        board = MagicMock(spec=['terrain'])
+        board.terrain = {(5, 5): "plains"}
+
+        without_general = defender._calculate_defense_modifiers(attacker, board)
+
+        defender.has_general = True
+        defender.general_id = 'leonidas'
+        self.assertAlmostEqual(defender._calculate_defense_modifiers(attacker, board), without_general * 1.2)
+
+    def test_compute_attack_preview(self) -> None:
+
+        """
+        Test the deterministic attack preview.
+        Verify it is repeatable, leaves both units untouched and includes the melee counter.
+        """
+
+        attacker = BaseUnit((5, 6), player=2, movement_range=2)
+        attacker.formations = {}
+        attacker.attack_type = "melee"
+        attacker.base_attack = 40
+        defender = BaseUnit((5, 5), player=1, movement_range=2)
+        defender.formations = {}
+        defender.attack_type = "melee"
+        defender.base_attack = 30
+
+        board = MagicMock(spec=['terrain'])
+        board.terrain = {(5, 5): "plains"}
+
+        preview = attacker.compute_attack_preview(defender, board)
+        self.assertEqual(attacker.compute_attack_preview(defender, board), preview)
+        self.assertGreater(preview[0], 0)
+        self.assertGreater(preview[1], 0)
+        self.assertEqual(defender.current_hp, defender.max_hp)
+        self.assertEqual(attacker.current_hp, attacker.max_hp)
+        self.assertFalse(attacker.has_attacked)
+
+        defender.player = 2
+        self.assertEqual(attacker.compute_attack_preview(defender, board), (0.0, 0.0))
+
+    def test_resolve_attacks_batch(self) -> None:
+
+        """
+        Test batched attack resolution.
+        Verify it matches calling attack for each pair in order with the same random stream.
+        """
+
+        board = MagicMock(spec=['terrain'])
+        board.terrain = {(5, 5): "plains", (7, 5): "plains"}
+
+        def make_units():
+            units = []
+            for position, player in (((5, 6), 2), ((5, 5), 1), ((7, 6), 2), ((7, 5), 1)):
+                unit = BaseUnit(position, player=player, movement_range=2)
+                unit.formations = {}
+                unit.attack_type = "melee"
+                unit.base_attack = 40
+                units.append(unit)
+            return units
+
+        random.seed(7)
+        expected = make_units()
+        expected[0].attack(expected[1], board)
+        expected[2].attack(expected[3], board)
+
+        random.seed(7)
+        units = make_units()
+        damage = BaseUnit.resolve_attacks_batch([units[0], units[2]], [units[1], units[3]], board)
+
+        self.assertEqual([unit.current_hp for unit in units], [unit.current_hp for unit in expected])
+        self.assertEqual(damage, [100 - expected[1].current_hp, 100 - expected[3].current_hp])
+
+        with self.assertRaises(ValueError):
+            BaseUnit.resolve_attacks_batch([units[0]], [], board)
+
+    def test_missing_sprite_is_looked_up_once(self) -> None:
+
+        """
+        Test that a sprite path found missing is not checked on disk again.
+        """
+
+        unit = BaseUnit((5, 5), player=1, movement_range=2)
+        sprite_path = "/nonexistent/sprites/test_missing_sprite.png"
+
+        with patch("classes.units.base.unit_rendering.os.path.exists", return_value=False) as exists:
+            self.assertIsNone(unit._load_sprite(sprite_path))
+            self.assertIsNone(unit._load_sprite(sprite_path))
+
+        exists.assert_called_once_with(sprite_path)
+
     def test_formation_modifier(self) -> None:
         
         """